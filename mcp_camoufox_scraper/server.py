@@ -6,10 +6,18 @@ and capture both HTML content and network requests.
 """
 
 import asyncio
-import json
+import functools
 import logging
-from typing import Any, Dict, List, Optional
-from urllib.parse import urlparse
+import re
+import sys
+import time
+from collections import defaultdict, deque
+from contextlib import AsyncExitStack, asynccontextmanager
+from itertools import islice
+from typing import Any, AsyncIterator, Callable, Deque, Dict, FrozenSet, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
+
+import orjson
 
 from mcp.server import Server
 from mcp.server.models import InitializationOptions
@@ -21,14 +29,199 @@ from camoufox import AsyncCamoufox
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+_URL_RE = re.compile(r"^https?://[^/\s]+", re.I)
+
+@functools.lru_cache(maxsize=256)
+def _valid_url(url: str) -> bool:
+    """Check that a URL has an http(s) scheme and a host"""
+    return bool(_URL_RE.match(url))
+
+def _normalize_url(url: str) -> str:
+    """Normalize a URL for cache lookups: lowercase scheme/host, sorted query, no fragment"""
+    parsed = urlparse(url)
+    query = urlencode(sorted(parse_qsl(parsed.query, keep_blank_values=True)))
+    return urlunparse((parsed.scheme.lower(), parsed.netloc.lower(), parsed.path or "/", parsed.params, query, ""))
+
+# Content types whose bodies can be fetched via get_response_body
+_TEXTUAL_PREFIXES = ("application/json", "application/xml", "text/")
+
+def _pack(obj: Any) -> str:
+    """Serialize a tool result to indented JSON text"""
+    return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+
+# Number of pre-warmed browser contexts available to concurrent tool calls
+POOL_SIZE = 3
+# Contexts are recycled after this many uses to shed accumulated state
+MAX_USES_PER_INSTANCE = 50
+# Larger, longer-lived Firefox DNS cache so repeat scrapes of a host skip resolution
+DNS_CACHE_PREFS = {
+    "network.dnsCacheEntries": 512,
+    "network.dnsCacheExpiration": 3600,
+}
+
+# Firefox prefs that stop font and media downloads; images are blocked with block_images.
+# Blocking assets changes the browser fingerprint (no images, no web fonts), which some
+# WAFs flag; this is accepted for default navigations to cut page-load cost.
+# capture_assets navigations run on an unblocked browser with the stock fingerprint.
+ASSET_BLOCKING_PREFS = {
+    "gfx.downloadable_fonts.enabled": False,
+    "media.autoplay.default": 5,
+    "media.preload.default": 0,
+}
+
+# Camoufox processes shared by every CamoufoxMCPServer in this process, one per
+# asset-blocking mode, started on first use and stopped when the last server
+# releases them. The state belongs to the event loop that started it (see _get_init_lock).
+_SHARED_CAMOUFOX: Dict[bool, AsyncCamoufox] = {}
+_SHARED_BROWSERS: Dict[bool, Any] = {}
+_SHARED_USERS: Dict[bool, int] = {}
+_SHARED_LOOP: Optional[asyncio.AbstractEventLoop] = None
+_INIT_LOCK: Optional[asyncio.Lock] = None
+
+def _get_init_lock() -> asyncio.Lock:
+    """Return the lock guarding the shared browsers, resetting state left by another event loop"""
+    global _SHARED_LOOP, _INIT_LOCK
+    loop = asyncio.get_running_loop()
+    if _SHARED_LOOP is not loop:
+        if _SHARED_CAMOUFOX:
+            # The Playwright connection died with its loop; it cannot be reused or closed from here
+            logger.warning("Discarding Camoufox browser started on a different event loop")
+        _SHARED_CAMOUFOX.clear()
+        _SHARED_BROWSERS.clear()
+        _SHARED_USERS.clear()
+        _SHARED_LOOP = loop
+        _INIT_LOCK = asyncio.Lock()
+    return _INIT_LOCK
+
+async def _acquire_shared_browser(block_assets: bool = True):
+    """Return the shared browser for a blocking mode, starting Camoufox if no server holds it yet"""
+    async with _get_init_lock():
+        if block_assets not in _SHARED_CAMOUFOX:
+            logger.info(f"Initializing Camoufox browser (block_assets={block_assets})...")
+            prefs = {**DNS_CACHE_PREFS, **ASSET_BLOCKING_PREFS} if block_assets else DNS_CACHE_PREFS
+            camoufox = AsyncCamoufox(
+                headless=True,
+                block_images=block_assets,
+                firefox_user_prefs=prefs,
+                # Acknowledges Camoufox's block_images LeakWarning; see ASSET_BLOCKING_PREFS
+                i_know_what_im_doing=block_assets
+            )
+            _SHARED_BROWSERS[block_assets] = await camoufox.__aenter__()
+            _SHARED_CAMOUFOX[block_assets] = camoufox
+        _SHARED_USERS[block_assets] = _SHARED_USERS.get(block_assets, 0) + 1
+        return _SHARED_BROWSERS[block_assets]
+
+async def _release_shared_browser(block_assets: bool = True):
+    """Drop a reference to a shared browser, stopping its Camoufox with the last one"""
+    async with _get_init_lock():
+        users = max(_SHARED_USERS.get(block_assets, 0) - 1, 0)
+        _SHARED_USERS[block_assets] = users
+        if users > 0 or block_assets not in _SHARED_CAMOUFOX:
+            return
+
+        camoufox = _SHARED_CAMOUFOX.pop(block_assets)
+        _SHARED_BROWSERS.pop(block_assets, None)
+        await camoufox.__aexit__(None, None, None)
+
+class BrowserPool:
+    """Pool of pre-created pages, one browser context each, sharing a single browser"""
+
+    def __init__(self, browser, size: int = POOL_SIZE, max_uses: int = MAX_USES_PER_INSTANCE, **context_options):
+        self.browser = browser
+        self.size = size
+        self.max_uses = max_uses
+        self.context_options = context_options
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._uses_per_context: Dict[Any, int] = {}
+
+    async def start(self):
+        """Create all pooled contexts up front"""
+        for _ in range(self.size):
+            self._queue.put_nowait(await self._new_page())
+
+    async def __aenter__(self) -> "BrowserPool":
+        try:
+            await self.start()
+        except Exception:
+            await self.close()
+            raise
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def _new_page(self):
+        context = await self.browser.new_context(**self.context_options)
+        self._uses_per_context[context] = 0
+        return await context.new_page()
+
+    async def _recycle(self, page):
+        context = page.context
+        self._uses_per_context.pop(context, None)
+        try:
+            await context.close()
+        except Exception as e:
+            logger.warning(f"Error closing recycled context: {e}")
+        return await self._new_page()
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[Any]:
+        """Borrow a page for the duration of the block"""
+        page = await self._queue.get()
+        try:
+            # Recycle worn-out contexts lazily, when they are next handed out, so
+            # responses from the navigation that wore them out stay readable until then
+            if self._uses_per_context.get(page.context, 0) >= self.max_uses:
+                page = await self._recycle(page)
+        except Exception:
+            # Keep the slot and retry the recycle on the next acquire
+            self._uses_per_context[page.context] = self.max_uses
+            self._queue.put_nowait(page)
+            raise
+
+        try:
+            yield page
+        finally:
+            context = page.context
+            self._uses_per_context[context] = self._uses_per_context.get(context, 0) + 1
+            self._queue.put_nowait(page)
+
+    async def close(self):
+        """Close every context created by the pool"""
+        for context in list(self._uses_per_context):
+            try:
+                await context.close()
+            except Exception as e:
+                logger.warning(f"Error closing pooled context: {e}")
+        self._uses_per_context.clear()
+
 class CamoufoxMCPServer:
+    # Resource types recorded by network monitoring (images, fonts, media etc. are skipped)
+    CAPTURE_TYPES = frozenset({"document", "xhr", "fetch", "script"})
+    # Maximum requests kept per navigation; the oldest are dropped first
+    MAX_REQUESTS = 2000
+    # Seconds a navigation result is reused for the same normalized URL
+    SCRAPE_CACHE_TTL = 60
+
     def __init__(self):
         self.server = Server("camoufox-scraper")
-        self.camoufox: Optional[AsyncCamoufox] = None
         self.browser = None
-        self.context = None
-        self.page = None
-        self.network_requests: List[Dict[str, Any]] = []
+        self.pool: Optional[BrowserPool] = None
+        # Pool on a browser without asset blocking, started on the first capture_assets navigation
+        self.assets_pool: Optional[BrowserPool] = None
+        self.js_off_pool: Optional[BrowserPool] = None
+        # Owns the Camoufox/browser/pool lifecycle; unwound by close_browser
+        self._stack = AsyncExitStack()
+        self._init_lock = asyncio.Lock()
+        # URL of the most recent navigation
+        self.current_url: Optional[str] = None
+        self.network_requests: Deque[Dict[str, Any]] = deque(maxlen=self.MAX_REQUESTS)
+        self.requests_by_type: Dict[str, Deque[Dict[str, Any]]] = defaultdict(deque)
+        # Textual responses kept for lazy body retrieval while the page is open
+        self._responses: Dict[int, Any] = {}
+        self._next_request_id = 0
+        # Recent navigations keyed by (normalized URL, capture types, capture assets)
+        self._scrape_cache: Dict[Tuple[str, FrozenSet[str], bool], Tuple[float, Dict[str, Any]]] = {}
 
         # Register tools
         self._register_tools()
@@ -53,6 +246,22 @@ class CamoufoxMCPServer:
                                 "type": "number",
                                 "description": "Time to wait after page load (seconds)",
                                 "default": 3
+                            },
+                            "capture_types": {
+                                "type": "array",
+                                "items": {"type": "string"},
+                                "description": "Resource types to capture (e.g. document, xhr, fetch, script, stylesheet, image)",
+                                "default": sorted(self.CAPTURE_TYPES)
+                            },
+                            "capture_assets": {
+                                "type": "boolean",
+                                "description": "Load images, fonts and media instead of blocking them",
+                                "default": False
+                            },
+                            "bypass_cache": {
+                                "type": "boolean",
+                                "description": f"Navigate even if the URL was scraped in the last {self.SCRAPE_CACHE_TTL} seconds",
+                                "default": False
                             }
                         },
                         "required": ["url"]
@@ -74,8 +283,37 @@ class CamoufoxMCPServer:
                         "properties": {
                             "filter_type": {
                                 "type": "string",
-                                "description": "Filter by request type (xhr, fetch, all)",
+                                "description": "Filter by resource type (e.g. xhr, fetch, document, script) or all",
                                 "default": "all"
+                            },
+                            "offset": {
+                                "type": "integer",
+                                "description": "Number of matching requests to skip",
+                                "minimum": 0,
+                                "default": 0
+                            },
+                            "limit": {
+                                "type": "integer",
+                                "description": "Maximum number of requests to return",
+                                "minimum": 1,
+                                "default": 100
+                            }
+                        }
+                    }
+                ),
+                types.Tool(
+                    name="get_response_body",
+                    description="Fetch the body of a captured textual response (JSON, XML, text) on demand",
+                    inputSchema={
+                        "type": "object",
+                        "properties": {
+                            "request_id": {
+                                "type": "integer",
+                                "description": "The id of a captured request, as listed by get_network_requests"
+                            },
+                            "url": {
+                                "type": "string",
+                                "description": "The URL of a captured request (the most recent match is used)"
                             }
                         }
                     }
@@ -99,6 +337,8 @@ class CamoufoxMCPServer:
                     return await self._get_page_html()
                 elif name == "get_network_requests":
                     return await self._get_network_requests(arguments)
+                elif name == "get_response_body":
+                    return await self._get_response_body(arguments)
                 elif name == "close_browser":
                     return await self._close_browser()
                 else:
@@ -108,41 +348,82 @@ class CamoufoxMCPServer:
                 return [types.TextContent(type="text", text=f"Error: {str(e)}")]
 
     async def _initialize_browser(self):
-        """Initialize Camoufox browser with JavaScript enabled for network monitoring"""
-        if self.camoufox is None:
-            logger.info("Initializing Camoufox browser...")
-            self.camoufox = AsyncCamoufox(
-                headless=False
-            )
+        """Attach to the shared Camoufox browser and create this server's pools of contexts"""
+        async with self._init_lock:
+            if self.pool is not None:
+                return
 
-            await self.camoufox.start()
-            self.browser = self.camoufox.browser
-
-            # Create a context with JavaScript enabled for network monitoring
-            self.context = await self.browser.new_context(java_script_enabled=True)
-            self.page = await self.context.new_page()
-
-            # Setup network request monitoring
-            await self._setup_network_monitoring()
+            try:
+                self.browser = await _acquire_shared_browser()
+                self._stack.push_async_callback(_release_shared_browser)
 
-            logger.info("Browser initialized successfully")
+                # Pre-create contexts with JavaScript enabled for network monitoring
+                self.pool = await self._stack.enter_async_context(
+                    BrowserPool(self.browser, java_script_enabled=True)
+                )
 
-    async def _setup_network_monitoring(self):
-        """Setup network request monitoring to capture XHR and API calls"""
-        if not self.page:
-            return
+                # A single persistent JavaScript-disabled context for clean HTML extraction
+                self.js_off_pool = await self._stack.enter_async_context(
+                    BrowserPool(self.browser, size=1, java_script_enabled=False)
+                )
+            except Exception:
+                # Tear down whatever was started before the failure
+                await self._close_resources()
+                raise
+
+            logger.info(f"Browser initialized successfully with {self.pool.size} pooled contexts")
+
+    async def _get_assets_pool(self) -> BrowserPool:
+        """Return the pool used for navigations that load images, fonts and media"""
+        await self._initialize_browser()
+        async with self._init_lock:
+            if self.assets_pool is None:
+                browser = await _acquire_shared_browser(block_assets=False)
+                self._stack.push_async_callback(_release_shared_browser, False)
+                self.assets_pool = await self._stack.enter_async_context(
+                    BrowserPool(browser, size=1, java_script_enabled=True)
+                )
+            return self.assets_pool
 
-        # Clear previous requests
-        self.network_requests = []
+    async def _prewarm(self):
+        """Start the browser pool in the background so the first tool call doesn't pay for it"""
+        try:
+            await self._initialize_browser()
+        except Exception as e:
+            logger.error(f"Error pre-warming browser: {e}")
+
+    async def _setup_network_monitoring(
+        self, page, capture_types: FrozenSet[str]
+    ) -> Tuple[Dict[str, Any], Callable[[], None]]:
+        """Setup network request monitoring on a page; return its capture state and a detach callback"""
+        loop = asyncio.get_running_loop()
+
+        # The capture stays private to this navigation until _publish_capture,
+        # so concurrent navigations never see each other's requests
+        network_requests: Deque[Dict[str, Any]] = deque(maxlen=self.MAX_REQUESTS)
+        requests_by_type: Dict[str, Deque[Dict[str, Any]]] = defaultdict(deque)
+        # Pending requests awaiting a response, keyed by Playwright request object
+        req_index: Dict[Any, Dict[str, Any]] = {}
+        responses: Dict[int, Any] = {}
+        capture = {
+            "network_requests": network_requests,
+            "requests_by_type": requests_by_type,
+            "responses": responses
+        }
 
         # Monitor network requests
         async def handle_request(request):
+            if request.resource_type not in capture_types:
+                return
+
+            self._next_request_id += 1
             request_data = {
+                "id": self._next_request_id,
                 "url": request.url,
                 "method": request.method,
-                "headers": dict(request.headers),
+                "headers": request.headers,
                 "resource_type": request.resource_type,
-                "timestamp": asyncio.get_event_loop().time()
+                "timestamp": loop.time()
             }
 
             # Capture request body for POST requests
@@ -152,121 +433,200 @@ class CamoufoxMCPServer:
                 except:
                     request_data["body"] = None
 
-            self.network_requests.append(request_data)
+            if len(network_requests) == network_requests.maxlen:
+                # The oldest request is about to be evicted; drop it from the indexes too
+                evicted = network_requests[0]
+                requests_by_type[evicted["resource_type"]].popleft()
+                responses.pop(evicted["id"], None)
+
+            network_requests.append(request_data)
+            requests_by_type[request.resource_type].append(request_data)
+            req_index[request] = request_data
             logger.info(f"Captured request: {request.method} {request.url}")
 
         # Monitor responses
         async def handle_response(response):
-            # Find the corresponding request
-            for req in self.network_requests:
-                if req["url"] == response.url and "response" not in req:
-                    try:
-                        # Capture response data for API calls
-                        if response.headers.get("content-type", "").startswith(("application/json", "application/xml", "text/")):
-                            content = await response.text()
-                            req["response"] = {
-                                "status": response.status,
-                                "headers": dict(response.headers),
-                                "content": content,
-                                "content_type": response.headers.get("content-type", "")
-                            }
-                        else:
-                            req["response"] = {
-                                "status": response.status,
-                                "headers": dict(response.headers),
-                                "content_type": response.headers.get("content-type", ""),
-                                "content": "[Binary or large content]"
-                            }
-                    except Exception as e:
-                        req["response"] = {
-                            "status": response.status,
-                            "headers": dict(response.headers),
-                            "error": str(e)
-                        }
-                    break
+            # Look up the corresponding request
+            req = req_index.pop(response.request, None)
+            if req is None:
+                return
+
+            headers = response.headers
+            content_type = headers.get("content-type", "")
+            try:
+                size = int(headers.get("content-length", 0))
+            except ValueError:
+                size = 0
+
+            # Only record metadata here; bodies are fetched lazily via get_response_body
+            req["response"] = {
+                "status": response.status,
+                "headers": headers,
+                "content_type": content_type,
+                "size": size
+            }
+            if content_type.lower().startswith(_TEXTUAL_PREFIXES):
+                responses[req["id"]] = response
 
         # Attach event listeners
-        self.page.on("request", handle_request)
-        self.page.on("response", handle_response)
+        page.on("request", handle_request)
+        page.on("response", handle_response)
+
+        def detach():
+            page.remove_listener("request", handle_request)
+            page.remove_listener("response", handle_response)
+
+        return capture, detach
+
+    def _publish_capture(self, current_url: str, capture: Dict[str, Any]):
+        """Make a navigation's capture the current page for the other tools"""
+        self.current_url = current_url
+        self.network_requests = capture["network_requests"]
+        self.requests_by_type = capture["requests_by_type"]
+        self._responses = capture["responses"]
 
     async def _navigate_to_url(self, arguments: Dict[str, Any]) -> List[types.TextContent]:
         """Navigate to a URL and return the HTML content"""
         url = arguments.get("url")
         wait_time = arguments.get("wait_time", 3)
+        capture_types = arguments.get("capture_types")
+        capture_assets = bool(arguments.get("capture_assets", False))
+        bypass_cache = bool(arguments.get("bypass_cache", False))
 
         if not url:
             return [types.TextContent(type="text", text="Error: URL is required")]
 
         # Validate URL
-        try:
-            parsed = urlparse(url)
-            if not parsed.scheme or not parsed.netloc:
-                return [types.TextContent(type="text", text="Error: Invalid URL format")]
-        except Exception as e:
-            return [types.TextContent(type="text", text=f"Error: Invalid URL - {str(e)}")]
+        if not isinstance(url, str) or not _valid_url(url):
+            return [types.TextContent(type="text", text="Error: Invalid URL format")]
 
-        try:
-            await self._initialize_browser()
-
-            logger.info(f"Navigating to: {url}")
+        if capture_types is not None and (
+            not isinstance(capture_types, list) or not all(isinstance(t, str) for t in capture_types)
+        ):
+            return [types.TextContent(type="text", text="Error: capture_types must be a list of strings")]
 
-            # Clear previous network requests
-            self.network_requests = []
+        capture_types = frozenset(capture_types) if capture_types else self.CAPTURE_TYPES
+        cache_key = (_normalize_url(url), capture_types, capture_assets)
 
-            # Navigate to the URL
-            await self.page.goto(url, wait_until="domcontentloaded", timeout=30000)
+        if not bypass_cache:
+            cached = self._get_cached_scrape(cache_key, wait_time)
+            if cached is not None:
+                logger.info(f"Serving cached navigation for: {url}")
+                return [types.TextContent(type="text", text=_pack(cached))]
 
-            # Wait for additional content to load
-            await asyncio.sleep(wait_time)
+        try:
+            if capture_assets:
+                pool = await self._get_assets_pool()
+            else:
+                await self._initialize_browser()
+                pool = self.pool
 
-            # Get page title and basic info
-            title = await self.page.title()
-            current_url = self.page.url
+            logger.info(f"Navigating to: {url}")
 
+            async with pool.acquire() as page:
+                capture, detach = await self._setup_network_monitoring(page, capture_types)
+                try:
+                    # Navigate to the URL
+                    await page.goto(url, wait_until="domcontentloaded", timeout=30000)
+
+                    # Wait for additional content to load
+                    await asyncio.sleep(wait_time)
+
+                    # Get page title and basic info, overlapping the browser round-trips
+                    title, rendered_html_length = await asyncio.gather(
+                        page.title(),
+                        page.evaluate("() => document.documentElement.outerHTML.length")
+                    )
+                    current_url = page.url
+                finally:
+                    detach()
+
+            captured = len(capture["network_requests"])
             result = {
                 "success": True,
                 "url": current_url,
                 "title": title,
-                "network_requests_captured": len(self.network_requests),
-                "message": f"Successfully navigated to {url}. Captured {len(self.network_requests)} network requests."
+                "rendered_html_length": rendered_html_length,
+                "network_requests_captured": captured,
+                "message": f"Successfully navigated to {url}. Captured {captured} network requests."
             }
 
-            return [types.TextContent(type="text", text=json.dumps(result, indent=2))]
+            self._store_scrape(cache_key, result, capture, wait_time)
+            self._publish_capture(current_url, capture)
+
+            return [types.TextContent(type="text", text=_pack(result))]
 
         except Exception as e:
             logger.error(f"Error navigating to URL: {e}")
             return [types.TextContent(type="text", text=f"Error navigating to URL: {str(e)}")]
 
+    def _get_cached_scrape(self, key: Tuple[str, FrozenSet[str], bool], wait_time: float) -> Optional[Dict[str, Any]]:
+        """Restore a recent navigation's state and return its result, if still fresh"""
+        cached = self._scrape_cache.get(key)
+        if cached is None:
+            return None
+
+        stored_at, entry = cached
+        if time.monotonic() - stored_at > self.SCRAPE_CACHE_TTL:
+            del self._scrape_cache[key]
+            return None
+
+        # A shorter wait captures fewer requests, so it can't answer a longer one
+        if entry["wait_time"] < wait_time:
+            return None
+
+        self._publish_capture(entry["result"]["url"], entry["capture"])
+        return {
+            **entry["result"],
+            "cached": True,
+            "note": "Served from cache; response bodies are unavailable. Use bypass_cache to navigate again."
+        }
+
+    def _store_scrape(
+        self, key: Tuple[str, FrozenSet[str], bool], result: Dict[str, Any], capture: Dict[str, Any], wait_time: float
+    ):
+        """Remember a navigation's result and captured requests"""
+        now = time.monotonic()
+        # Drop expired entries so the cache stays small
+        for stale in [k for k, (stored_at, _) in self._scrape_cache.items() if now - stored_at > self.SCRAPE_CACHE_TTL]:
+            del self._scrape_cache[stale]
+
+        # Response objects belong to a page that will navigate again or be recycled,
+        # so only the request metadata is cached
+        self._scrape_cache[key] = (now, {
+            "result": result,
+            "capture": {**capture, "responses": {}},
+            "wait_time": wait_time
+        })
+
     async def _get_page_html(self) -> List[types.TextContent]:
         """Get the current page's HTML content with JavaScript disabled"""
-        if not self.page:
+        if not self.current_url:
             return [types.TextContent(type="text", text="Error: No page loaded. Use navigate_to_url first.")]
 
         try:
-            current_url = self.page.url
+            current_url = self.current_url
 
-            # Create a new context with JavaScript disabled for clean HTML extraction
-            js_disabled_context = await self.browser.new_context(java_script_enabled=False)
-            js_disabled_page = await js_disabled_context.new_page()
+            # Reuse the persistent JavaScript-disabled page for clean HTML extraction
+            async with self.js_off_pool.acquire() as js_disabled_page:
+                # Navigate to the same URL with JS disabled
+                await js_disabled_page.goto(current_url, wait_until="domcontentloaded", timeout=30000)
 
-            # Navigate to the same URL with JS disabled
-            await js_disabled_page.goto(current_url, wait_until="domcontentloaded", timeout=30000)
-
-            # Extract HTML content
-            html_content = await js_disabled_page.content()
-
-            # Clean up the temporary context
-            await js_disabled_context.close()
+                # Extract HTML content
+                html_content = await js_disabled_page.content()
 
             result = {
                 "success": True,
                 "url": current_url,
                 "html_length": len(html_content),
-                "html_content": html_content,
-                "note": "HTML extracted with JavaScript disabled for clean content"
+                "note": "HTML extracted with JavaScript disabled for clean content; the raw HTML follows as a separate text item"
             }
 
-            return [types.TextContent(type="text", text=json.dumps(result, indent=2))]
+            # Send the HTML as its own item so it isn't escaped and copied into the JSON payload
+            return [
+                types.TextContent(type="text", text=_pack(result)),
+                types.TextContent(type="text", text=html_content)
+            ]
 
         except Exception as e:
             logger.error(f"Error getting page HTML: {e}")
@@ -275,42 +635,94 @@ class CamoufoxMCPServer:
     async def _get_network_requests(self, arguments: Dict[str, Any]) -> List[types.TextContent]:
         """Get captured network requests"""
         filter_type = arguments.get("filter_type", "all").lower()
+        offset = arguments.get("offset", 0)
+        limit = arguments.get("limit", 100)
+
+        if not isinstance(offset, int) or isinstance(offset, bool) or offset < 0:
+            return [types.TextContent(type="text", text="Error: offset must be a non-negative integer")]
+        if not isinstance(limit, int) or isinstance(limit, bool) or limit < 1:
+            return [types.TextContent(type="text", text="Error: limit must be a positive integer")]
 
         try:
-            filtered_requests = self.network_requests
+            if filter_type == "all":
+                matching = self.network_requests
+            else:
+                matching = self.requests_by_type.get(filter_type, ())
 
-            if filter_type == "xhr":
-                filtered_requests = [req for req in self.network_requests if req.get("resource_type") == "xhr"]
-            elif filter_type == "fetch":
-                filtered_requests = [req for req in self.network_requests if req.get("resource_type") == "fetch"]
+            page = islice(matching, offset, offset + limit)
 
             result = {
                 "success": True,
                 "total_requests": len(self.network_requests),
-                "filtered_requests": len(filtered_requests),
+                "filtered_requests": len(matching),
                 "filter_applied": filter_type,
-                "requests": filtered_requests
+                "offset": offset,
+                "limit": limit,
+                "has_more": offset + limit < len(matching),
+                "requests": list(page)
             }
 
-            return [types.TextContent(type="text", text=json.dumps(result, indent=2))]
+            return [types.TextContent(type="text", text=_pack(result))]
 
         except Exception as e:
             logger.error(f"Error getting network requests: {e}")
             return [types.TextContent(type="text", text=f"Error getting network requests: {str(e)}")]
 
+    async def _get_response_body(self, arguments: Dict[str, Any]) -> List[types.TextContent]:
+        """Fetch the body of a captured response on demand"""
+        request_id = arguments.get("request_id")
+        url = arguments.get("url")
+
+        if request_id is None and not url:
+            return [types.TextContent(type="text", text="Error: request_id or url is required")]
+
+        if request_id is None:
+            matches = [req["id"] for req in self.network_requests if req["url"] == url and req["id"] in self._responses]
+            if not matches:
+                return [types.TextContent(type="text", text=f"Error: No textual response captured for {url}")]
+            request_id = matches[-1]
+
+        response = self._responses.get(request_id)
+        if response is None:
+            return [types.TextContent(type="text", text=f"Error: No textual response captured for request {request_id}")]
+
+        try:
+            content = await response.text()
+
+            result = {
+                "success": True,
+                "request_id": request_id,
+                "url": response.url,
+                "status": response.status,
+                "content_type": response.headers.get("content-type", ""),
+                "content": content
+            }
+
+            return [types.TextContent(type="text", text=_pack(result))]
+
+        except Exception as e:
+            logger.error(f"Error getting response body: {e}")
+            return [types.TextContent(type="text", text=f"Error getting response body: {str(e)}")]
+
+    async def _close_resources(self):
+        """Unwind the pools, browser and Camoufox in reverse start order"""
+        stack, self._stack = self._stack, AsyncExitStack()
+        self.browser = None
+        self.pool = None
+        self.assets_pool = None
+        self.js_off_pool = None
+        await stack.aclose()
+
     async def _close_browser(self) -> List[types.TextContent]:
         """Close the browser and cleanup resources"""
         try:
-            if self.context:
-                await self.context.close()
-            if self.browser:
-                await self.browser.close()
+            await self._close_resources()
 
-            self.camoufox = None
-            self.browser = None
-            self.context = None
-            self.page = None
-            self.network_requests = []
+            self.current_url = None
+            self.network_requests = deque(maxlen=self.MAX_REQUESTS)
+            self.requests_by_type = defaultdict(deque)
+            self._responses = {}
+            self._scrape_cache = {}
 
             logger.info("Browser closed successfully")
             return [types.TextContent(type="text", text="Browser closed successfully")]
@@ -322,20 +734,45 @@ class CamoufoxMCPServer:
 async def main():
     """Main entry point for the MCP server"""
     server_instance = CamoufoxMCPServer()
-
-    async with stdio_server() as (read_stream, write_stream):
-        await server_instance.server.run(
-            read_stream,
-            write_stream,
-            InitializationOptions(
-                server_name="camoufox-scraper",
-                server_version="0.1.0",
-                capabilities=server_instance.server.get_capabilities(
-                    notification_options=None,
-                    experimental_capabilities=None,
-                )
-            ),
-        )
+    prewarm = asyncio.create_task(server_instance._prewarm())
+
+    try:
+        async with stdio_server() as (read_stream, write_stream):
+            await server_instance.server.run(
+                read_stream,
+                write_stream,
+                InitializationOptions(
+                    server_name="camoufox-scraper",
+                    server_version="0.1.0",
+                    capabilities=server_instance.server.get_capabilities(
+                        notification_options=None,
+                        experimental_capabilities=None,
+                    )
+                ),
+            )
+    finally:
+        # Stop the browser on stdin EOF or cancellation so no Firefox process outlives the server
+        prewarm.cancel()
+        try:
+            await prewarm
+        except asyncio.CancelledError:
+            pass
+        await server_instance._close_resources()
+
+def run():
+    """Run the server, on the libuv-based event loop when uvloop is available (not on Windows)"""
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+        return
+
+    if sys.version_info >= (3, 12):
+        # uvloop.install() is deprecated from Python 3.12
+        uvloop.run(main())
+    else:
+        uvloop.install()
+        asyncio.run(main())
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run()
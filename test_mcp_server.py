@@ -51,7 +51,7 @@ async def test_mcp_server():
             logger.info(f"  URL: {response_data['url']}")
             
             # Check if HTML contains expected content
-            html_content = response_data['html_content']
+            html_content = result[1].text
             if "Example Domain" in html_content:
                 logger.info("  ✓ HTML content looks correct")
             else:
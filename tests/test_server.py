@@ -0,0 +1,344 @@
+"""
+Unit tests for the browser pool and network capture, using stub Playwright objects
+so no real browser is launched.
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from mcp_camoufox_scraper.server import BrowserPool, CamoufoxMCPServer, _normalize_url, _valid_url
+
+
+class FakeRequest:
+    def __init__(self, url, resource_type):
+        self.url = url
+        self.resource_type = resource_type
+        self.method = "GET"
+        self.headers = {"accept": "*/*"}
+        self.post_data = None
+
+
+class FakeResponse:
+    def __init__(self, page, request, content_type):
+        self._page = page
+        self.request = request
+        self.url = request.url
+        self.status = 200
+        self.headers = {"content-type": content_type, "content-length": "42"}
+
+    async def text(self):
+        if self._page.context.closed:
+            raise RuntimeError("Target closed")
+        return f"body of {self.url}"
+
+
+class FakeContext:
+    def __init__(self, browser):
+        self.browser = browser
+        self.closed = False
+
+    async def new_page(self):
+        return FakePage(self)
+
+    async def close(self):
+        self.closed = True
+
+
+class FakePage:
+    def __init__(self, context):
+        self.context = context
+        self.url = "about:blank"
+        self._listeners = {"request": [], "response": []}
+
+    def on(self, event, handler):
+        self._listeners[event].append(handler)
+
+    def remove_listener(self, event, handler):
+        self._listeners[event].remove(handler)
+
+    async def goto(self, url, **kwargs):
+        self.url = url
+        for sub_url, resource_type, content_type in self.context.browser.scripts[url]:
+            request = FakeRequest(sub_url, resource_type)
+            for handler in list(self._listeners["request"]):
+                await handler(request)
+            # Yield so concurrent navigations interleave their events
+            await asyncio.sleep(0)
+            response = FakeResponse(self, request, content_type)
+            for handler in list(self._listeners["response"]):
+                await handler(response)
+
+    async def title(self):
+        return f"Title of {self.url}"
+
+    async def evaluate(self, expression):
+        return 1234
+
+    async def content(self):
+        return f"<html><title>{self.url}</title></html>"
+
+
+class FakeBrowser:
+    def __init__(self, scripts=None):
+        # URL -> list of (request url, resource type, content type) emitted by goto
+        self.scripts = scripts or {}
+        self.contexts = []
+
+    async def new_context(self, **options):
+        context = FakeContext(self)
+        self.contexts.append(context)
+        return context
+
+
+def _requests(base, count, resource_type="xhr"):
+    return [(f"{base}/api/{i}", resource_type, "application/json") for i in range(count)]
+
+
+def _data(result):
+    return json.loads(result[0].text)
+
+
+async def _server(browser, **pool_options):
+    server = CamoufoxMCPServer()
+    server.pool = await BrowserPool(browser, **pool_options).__aenter__()
+    return server
+
+
+async def test_pool_acquire_blocks_when_exhausted():
+    pool = await BrowserPool(FakeBrowser(), size=1).__aenter__()
+
+    async def borrow():
+        async with pool.acquire() as borrowed:
+            return borrowed
+
+    async with pool.acquire() as page:
+        waiter = asyncio.create_task(borrow())
+        await asyncio.sleep(0)
+        assert not waiter.done()
+
+    assert await waiter is page
+
+
+async def test_pool_recycles_on_next_acquire():
+    browser = FakeBrowser()
+    pool = await BrowserPool(browser, size=1, max_uses=1).__aenter__()
+
+    async with pool.acquire() as first:
+        pass
+    # The worn-out context stays open until the page is handed out again
+    assert not first.context.closed
+
+    async with pool.acquire() as second:
+        assert second is not first
+        assert first.context.closed
+        assert not second.context.closed
+
+
+async def test_pool_close_closes_all_contexts():
+    browser = FakeBrowser()
+    async with BrowserPool(browser, size=3):
+        pass
+
+    assert len(browser.contexts) == 3
+    assert all(context.closed for context in browser.contexts)
+
+
+async def test_concurrent_navigations_keep_their_own_capture():
+    browser = FakeBrowser({
+        "https://a.test/": _requests("https://a.test", 3),
+        "https://b.test/": _requests("https://b.test", 5),
+    })
+    server = await _server(browser, size=2)
+
+    result_a, result_b = await asyncio.gather(
+        server._navigate_to_url({"url": "https://a.test/", "wait_time": 0}),
+        server._navigate_to_url({"url": "https://b.test/", "wait_time": 0}),
+    )
+
+    assert _data(result_a)["network_requests_captured"] == 3
+    assert _data(result_b)["network_requests_captured"] == 5
+
+    # The cache entry for A must hold A's requests, not B's
+    cached = _data(await server._navigate_to_url({"url": "https://a.test/", "wait_time": 0}))
+    assert cached["cached"] is True
+    assert server.current_url == "https://a.test/"
+    assert all(req["url"].startswith("https://a.test") for req in server.network_requests)
+    assert len(server.network_requests) == 3
+
+
+async def test_response_body_survives_context_wear_out():
+    browser = FakeBrowser({"https://a.test/": _requests("https://a.test", 1)})
+    server = await _server(browser, size=1, max_uses=1)
+
+    await server._navigate_to_url({"url": "https://a.test/", "wait_time": 0})
+    data = _data(await server._get_response_body({"url": "https://a.test/api/0"}))
+
+    assert data["content"] == "body of https://a.test/api/0"
+
+
+async def test_responses_record_metadata_only():
+    browser = FakeBrowser({"https://a.test/": _requests("https://a.test", 1)})
+    server = await _server(browser, size=1)
+
+    await server._navigate_to_url({"url": "https://a.test/", "wait_time": 0})
+    response = server.network_requests[0]["response"]
+
+    assert response["size"] == 42
+    assert "content" not in response
+    assert set(server._responses) == {server.network_requests[0]["id"]}
+
+
+async def test_capture_types_must_be_a_list():
+    server = CamoufoxMCPServer()
+
+    result = await server._navigate_to_url({"url": "https://a.test/", "capture_types": "xhr"})
+
+    assert result[0].text.startswith("Error:")
+
+
+async def test_capture_types_filters_requests():
+    script = _requests("https://a.test", 2, "xhr") + _requests("https://a.test/i", 2, "image")
+    browser = FakeBrowser({"https://a.test/": script})
+    server = await _server(browser, size=1)
+
+    await server._navigate_to_url({"url": "https://a.test/", "wait_time": 0, "capture_types": ["image"]})
+
+    assert [req["resource_type"] for req in server.network_requests] == ["image", "image"]
+
+
+async def test_get_network_requests_paginates():
+    browser = FakeBrowser({"https://a.test/": _requests("https://a.test", 5)})
+    server = await _server(browser, size=1)
+    await server._navigate_to_url({"url": "https://a.test/", "wait_time": 0})
+
+    data = _data(await server._get_network_requests({"offset": 3, "limit": 2}))
+
+    assert data["total_requests"] == 5
+    assert data["has_more"] is False
+    assert [req["url"] for req in data["requests"]] == ["https://a.test/api/3", "https://a.test/api/4"]
+
+
+@pytest.mark.parametrize("arguments", [
+    {"offset": "abc"},
+    {"offset": -1},
+    {"limit": 0},
+    {"limit": "10"},
+])
+async def test_get_network_requests_rejects_bad_pagination(arguments):
+    server = CamoufoxMCPServer()
+
+    result = await server._get_network_requests(arguments)
+
+    assert result[0].text.startswith("Error:")
+
+
+@pytest.mark.parametrize("filter_type,expected", [
+    ("all", 7),
+    ("xhr", 5),
+    ("script", 2),
+    ("document", 0),
+])
+async def test_get_network_requests_filters_by_type(filter_type, expected):
+    script = _requests("https://a.test", 5, "xhr") + _requests("https://a.test/s", 2, "script")
+    browser = FakeBrowser({"https://a.test/": script})
+    server = await _server(browser, size=1)
+    await server._navigate_to_url({"url": "https://a.test/", "wait_time": 0})
+
+    data = _data(await server._get_network_requests({"filter_type": filter_type}))
+
+    assert data["filtered_requests"] == expected
+    assert len(data["requests"]) == expected
+    if filter_type != "all":
+        assert all(req["resource_type"] == filter_type for req in data["requests"])
+
+
+async def test_navigation_reports_rendered_html_length():
+    browser = FakeBrowser({"https://a.test/": []})
+    server = await _server(browser, size=1)
+
+    data = _data(await server._navigate_to_url({"url": "https://a.test/", "wait_time": 0}))
+
+    assert data["title"] == "Title of https://a.test/"
+    assert data["rendered_html_length"] == 1234
+    assert "html_length" not in data
+
+
+@pytest.mark.parametrize("url,expected", [
+    ("https://example.com", True),
+    ("HTTP://example.com/path", True),
+    ("ftp://example.com", False),
+    ("https:///path", False),
+    ("example.com", False),
+])
+def test_valid_url(url, expected):
+    assert _valid_url(url) is expected
+
+
+async def test_eviction_keeps_indexes_consistent():
+    script = _requests("https://a.test", 3, "xhr") + _requests("https://a.test/f", 2, "fetch")
+    browser = FakeBrowser({"https://a.test/": script})
+    server = await _server(browser, size=1)
+    server.MAX_REQUESTS = 3
+
+    await server._navigate_to_url({"url": "https://a.test/", "wait_time": 0})
+
+    kept = list(server.network_requests)
+    assert [req["url"] for req in kept] == [
+        "https://a.test/api/2",
+        "https://a.test/f/api/0",
+        "https://a.test/f/api/1",
+    ]
+    assert list(server.requests_by_type["xhr"]) == kept[:1]
+    assert list(server.requests_by_type["fetch"]) == kept[1:]
+    assert set(server._responses) == {req["id"] for req in kept}
+
+
+def test_normalize_url():
+    assert _normalize_url("HTTPS://Example.COM?b=2&a=1#frag") == "https://example.com/?a=1&b=2"
+    assert _normalize_url("https://example.com/x?a=1") == _normalize_url("https://EXAMPLE.com/x?a=1#y")
+
+
+async def test_cache_hit_has_no_response_bodies():
+    browser = FakeBrowser({"https://a.test/": _requests("https://a.test", 1)})
+    server = await _server(browser, size=1)
+
+    await server._navigate_to_url({"url": "https://a.test/", "wait_time": 0})
+    cached = _data(await server._navigate_to_url({"url": "https://A.test/", "wait_time": 0}))
+    assert cached["cached"] is True
+
+    result = await server._get_response_body({"url": "https://a.test/api/0"})
+    assert result[0].text.startswith("Error:")
+
+    fresh = _data(await server._navigate_to_url({"url": "https://a.test/", "wait_time": 0, "bypass_cache": True}))
+    assert "cached" not in fresh
+
+
+async def test_cache_ignores_entries_with_a_shorter_wait():
+    browser = FakeBrowser({"https://a.test/": _requests("https://a.test", 1)})
+    server = await _server(browser, size=1)
+
+    await server._navigate_to_url({"url": "https://a.test/", "wait_time": 0})
+    longer = _data(await server._navigate_to_url({"url": "https://a.test/", "wait_time": 0.01}))
+    assert "cached" not in longer
+
+    # The longer capture can answer a shorter request
+    shorter = _data(await server._navigate_to_url({"url": "https://a.test/", "wait_time": 0}))
+    assert shorter["cached"] is True
+
+
+async def test_get_page_html_returns_metadata_then_raw_html():
+    browser = FakeBrowser({"https://a.test/": []})
+    server = await _server(browser, size=1)
+    server.js_off_pool = await BrowserPool(browser, size=1, java_script_enabled=False).__aenter__()
+    await server._navigate_to_url({"url": "https://a.test/", "wait_time": 0})
+
+    result = await server._get_page_html()
+
+    assert len(result) == 2
+    metadata = _data(result)
+    assert metadata["url"] == "https://a.test/"
+    assert metadata["html_length"] == len(result[1].text)
+    assert "html_content" not in metadata
+    assert result[1].text == "<html><title>https://a.test/</title></html>"